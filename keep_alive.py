@@ -2,13 +2,14 @@
 Keep-alive script for Render free tier
 Pings the backend every 14 minutes to prevent sleep
 """
-import requests
+from urllib.request import urlopen
 import os
 
 BACKEND_URL = os.getenv("BACKEND_URL", "https://clinic-voice-agent.onrender.com")
 
 try:
-    response = requests.get(f"{BACKEND_URL}/")
-    print(f"Ping successful: {response.status_code} - {response.json()}")
+    with urlopen(f"{BACKEND_URL}/ping", timeout=5) as response:
+        response.read()
+        print(f"Ping successful: {response.status}")
 except Exception as e:
     print(f"Ping failed: {e}")
@@ -4,13 +4,85 @@ FastAPI Backend for Clinic Voice Agent
 Handles availability checking and appointment booking
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime, timedelta
-from typing import List
-import json
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, field_validator
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from typing import Any
+import asyncio
+import functools
+import hashlib
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+import orjson
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
+class BookingRequest(BaseModel):
+    """Body of a /log_booking request"""
+    name: str = ""
+    doctor: str = ""
+    day: str = ""
+    slot: str = ""
+
+    @field_validator("name", "doctor", "day", "slot", mode="before")
+    @classmethod
+    def _as_text(cls, value: Any) -> str:
+        # null or non-string values count as missing so the agent still gets a spoken reply
+        return value if isinstance(value, str) else ""
+
+    @field_validator("name", "doctor", "slot")
+    @classmethod
+    def _strip(cls, value: str) -> str:
+        return value.strip()
+
+    @field_validator("day")
+    @classmethod
+    def _capitalize(cls, value: str) -> str:
+        return value.strip().capitalize()
+
+
+# Booking log records go through a queue and are written by a background thread
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load data on startup and flush pending writes on shutdown"""
+    _log_listener.start()
+    try:
+        await load_data()
+        yield
+        await flush_appointments()
+    finally:
+        _log_listener.stop()
+
 
-app = FastAPI(title="Clinic Voice Agent Backend")
+app = FastAPI(
+    title="Clinic Voice Agent Backend",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,54 +96,220 @@ KNOWLEDGE_BASE_FILE = "knowledge_base.json"
 SCHEDULES_FILE = "schedules.json"
 APPOINTMENTS_FILE = "appointments.json"
 
+# Slot length and lunch break, in minutes since midnight
+SLOT_MINUTES = 30
+LUNCH_START_MIN = 13 * 60
+LUNCH_END_MIN = 14 * 60
+
+# Weekday name -> datetime.weekday() index
+_DAY_INDEX = {
+    "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
+    "Friday": 4, "Saturday": 5, "Sunday": 6,
+}
+
+# Wall-clock reads are shared for this long (seconds, monotonic clock)
+_NOW_TTL = 0.5
+_now_cache: tuple[float, datetime] | None = None
+
+# Parsed JSON files keyed by filename -> (mtime_ns, data)
+_JSON_CACHE: dict[str, tuple[int, Any]] = {}
+
+# Serialized JSON files keyed by filename -> (parsed data, bytes, etag)
+_BYTES_CACHE: dict[str, tuple[Any, bytes, str]] = {}
+STATIC_CACHE_CONTROL = "public, max-age=60"
+
+# In-process appointment list, loaded on startup and persisted in the background
+APPOINTMENTS: list = []
+_APPOINTMENTS_WRITE_LOCK = threading.Lock()
+_PENDING_WRITES: set[asyncio.Task] = set()
+_STREAM_BATCH_SIZE = 256
+
+# Per-day schedule metadata, rebuilt whenever schedules.json is reloaded
+DAY_META: dict[str, dict] = {}
+_DAY_META_SOURCE: Any = None
+
+# Booked (start_min, end_min) intervals grouped by calendar date
+APPTS_BY_DATE: defaultdict[date, list[tuple[int, int]]] = defaultdict(list)
+
 
 def load_json(filename: str) -> dict | list:
-    """Load JSON data from file"""
+    """Load JSON data from file, reusing the parsed copy until the file changes"""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        mtime = os.stat(filename).st_mtime_ns
+        cached = _JSON_CACHE.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
     except FileNotFoundError:
         raise HTTPException(status_code=500, detail=f"File {filename} not found")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=500, detail=f"Invalid JSON in {filename}")
+    _JSON_CACHE[filename] = (mtime, data)
+    return data
+
+
+def save_json(filename: str, data: dict | list, pretty: bool = False):
+    """Save JSON data to file atomically and refresh its cache entry"""
+    data_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    tmp_path = f"{filename}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data_bytes)
+    os.replace(tmp_path, filename)
+    _JSON_CACHE[filename] = (os.stat(filename).st_mtime_ns, data)
+
+
+def json_file_payload(filename: str) -> tuple[bytes, str]:
+    """Return the serialized contents of a JSON file and their ETag, recomputed only when it changes"""
+    data = load_json(filename)
+    cached = _BYTES_CACHE.get(filename)
+    if cached is not None and cached[0] is data:
+        return cached[1], cached[2]
+    data_bytes = orjson.dumps(data)
+    etag = f'"{hashlib.blake2b(data_bytes, digest_size=16).hexdigest()}"'
+    _BYTES_CACHE[filename] = (data, data_bytes, etag)
+    return data_bytes, etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 13.1.2): ignores W/ prefixes, '*' matches"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def static_json_response(request: Request, filename: str) -> Response:
+    """Serve a JSON file's cached bytes, or 304 if the client already has them"""
+    data_bytes, etag = json_file_payload(filename)
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=data_bytes, headers=headers, media_type="application/json")
+
+
+def _write_appointments():
+    """Write the current appointments list to disk, one writer at a time"""
+    # Snapshot under the lock so whichever writer runs last stores the newest state
+    with _APPOINTMENTS_WRITE_LOCK:
+        save_json(APPOINTMENTS_FILE, list(APPOINTMENTS))
+
+
+def index_appointment(appointment: dict):
+    """Add a stored appointment to the by-date index"""
+    if "start_min" in appointment:
+        APPTS_BY_DATE[date.fromisoformat(appointment["date"])].append(
+            (appointment["start_min"], appointment["end_min"])
+        )
+        return
+    # Legacy rows only carry ISO timestamps
+    appt_start = datetime.fromisoformat(appointment["start_time"])
+    appt_end = datetime.fromisoformat(appointment["end_time"])
+    APPTS_BY_DATE[appt_start.date()].append((to_minutes(appt_start), to_minutes(appt_end)))
+
+
+def rebuild_appointment_index():
+    """Rebuild the by-date index from the in-memory appointments list"""
+    APPTS_BY_DATE.clear()
+    for appointment in APPOINTMENTS:
+        index_appointment(appointment)
+
+
+def stream_json_array(items: list):
+    """Yield a JSON array a batch of elements at a time"""
+    yield b"["
+    for i in range(0, len(items), _STREAM_BATCH_SIZE):
+        chunk = b",".join(orjson.dumps(item) for item in items[i:i + _STREAM_BATCH_SIZE])
+        yield chunk if i == 0 else b"," + chunk
+    yield b"]"
+
+
+def persist_appointments():
+    """Schedule a background write of the current appointments list"""
+    task = asyncio.create_task(asyncio.to_thread(_write_appointments))
+    _PENDING_WRITES.add(task)
+    task.add_done_callback(_PENDING_WRITES.discard)
+
+
+def parse_minutes(time_str: str) -> int:
+    """Convert an 'HH:MM' string to minutes since midnight"""
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def to_minutes(dt: datetime) -> int:
+    """Minutes since midnight for a datetime"""
+    return dt.hour * 60 + dt.minute
+
+
+@functools.lru_cache(maxsize=256)
+def parse_slot_minutes(slot: str) -> int:
+    """Validate a requested 'HH:MM' slot and return it as minutes since midnight"""
+    return to_minutes(datetime.strptime(slot, "%H:%M"))
+
+
+def format_minutes(minutes: int) -> str:
+    """Format minutes since midnight as 'HH:MM'"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def generate_time_slots(start: str, end: str, interval: int = SLOT_MINUTES) -> range:
+    """Generate slot start times (minutes since midnight) between start and end time"""
+    return range(parse_minutes(start), parse_minutes(end), interval)
+
+
+def get_day_meta() -> dict[str, dict]:
+    """Return per-day schedule metadata, rebuilding it only when schedules.json changes"""
+    global _DAY_META_SOURCE
+    schedules = load_json(SCHEDULES_FILE)
+    if schedules is not _DAY_META_SOURCE:
+        DAY_META.clear()
+        for day, schedule in schedules.items():
+            all_slots = tuple(generate_time_slots(schedule["start_time"], schedule["end_time"]))
+            available = tuple(
+                m for m in all_slots
+                if not (LUNCH_START_MIN <= m < LUNCH_END_MIN)
+            )
+            DAY_META[day] = {
+                "doctor": schedule["doctor"],
+                "start_time": schedule["start_time"],
+                "end_time": schedule["end_time"],
+                "work_start_min": parse_minutes(schedule["start_time"]),
+                "work_end_min": parse_minutes(schedule["end_time"]),
+                "all_slot_minutes": all_slots,
+                "available_template": available,
+                "available_labels": tuple(format_minutes(m) for m in available),
+            }
+        _DAY_META_SOURCE = schedules
+    return DAY_META
 
 
-def save_json(filename: str, data: dict | list):
-    """Save JSON data to file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def current_time() -> datetime:
+    """Return datetime.now(), reusing the last reading for up to _NOW_TTL seconds"""
+    global _now_cache
+    mono = time.monotonic()
+    if _now_cache is None or mono - _now_cache[0] > _NOW_TTL:
+        _now_cache = (mono, datetime.now())
+    return _now_cache[1]
 
 
-def generate_time_slots(start: str, end: str, interval: int = 30) -> List[str]:
-    """Generate time slots between start and end time with given interval in minutes"""
-    slots = []
-    start_time = datetime.strptime(start, "%H:%M")
-    end_time = datetime.strptime(end, "%H:%M")
-    
-    current_time = start_time
-    while current_time < end_time:
-        slots.append(current_time.strftime("%H:%M"))
-        current_time += timedelta(minutes=interval)
-    
-    return slots
+async def _today() -> datetime:
+    """Request-scoped current time dependency"""
+    return current_time()
 
 
-def get_day_date(day_name: str) -> datetime:
+def get_day_date(day_name: str, today: datetime | None = None) -> datetime:
     """Get the next occurrence of the given day name"""
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    today = datetime.now()
-    target_day = days.index(day_name.capitalize())
-    current_day = today.weekday()
-    
-    days_ahead = target_day - current_day
-    if days_ahead < 0:
-        days_ahead += 7
-    elif days_ahead == 0:
-        days_ahead = 0
-    
-    return today + timedelta(days=days_ahead)
+    target_day = _DAY_INDEX[day_name.capitalize()]
+    if today is None:
+        today = current_time()
+    return today + timedelta(days=(target_day - today.weekday()) % 7)
 
 
+@functools.lru_cache(maxsize=64)
 def _ordinal(n: int) -> str:
     """Return ordinal string for an integer (1 -> 1st, 2 -> 2nd, etc.)"""
     if 10 <= (n % 100) <= 20:
@@ -86,18 +324,20 @@ def format_date_ordinal(dt: datetime) -> str:
     return f"{_ordinal(dt.day)} {dt.strftime('%b')} {dt.year}"
 
 
-def is_time_in_range(time_str: str, start: datetime, end: datetime, date_obj: datetime) -> bool:
-    """Check if a time slot overlaps with a booked appointment"""
-    slot_time = datetime.strptime(time_str, "%H:%M")
-    slot_datetime = date_obj.replace(
-        hour=slot_time.hour,
-        minute=slot_time.minute,
-        second=0,
-        microsecond=0
-    )
-    
-    slot_end = slot_datetime + timedelta(minutes=30)
-    return (slot_datetime < end and slot_end > start)
+async def load_data():
+    """Load persisted appointments and pre-serialize the static payloads"""
+    APPOINTMENTS[:] = load_json(APPOINTMENTS_FILE)
+    rebuild_appointment_index()
+    # Serialize the static payloads up front so the first requests are served from bytes
+    json_file_payload(KNOWLEDGE_BASE_FILE)
+    json_file_payload(SCHEDULES_FILE)
+    get_day_meta()
+
+
+async def flush_appointments():
+    """Wait for any in-flight appointment writes to finish"""
+    if _PENDING_WRITES:
+        await asyncio.gather(*_PENDING_WRITES)
 
 
 @app.get("/")
@@ -117,9 +357,8 @@ async def ping():
 
 
 @app.get("/today")
-async def get_today():
+async def get_today(today: datetime = Depends(_today)):
     """Get current day and date"""
-    today = datetime.now()
     return {
         "day": today.strftime("%A"),
         "date": today.strftime("%Y-%m-%d"),
@@ -130,78 +369,69 @@ async def get_today():
 @app.delete("/appointments/clear")
 async def clear_all_appointments():
     """Clear all appointments (admin only)"""
-    save_json(APPOINTMENTS_FILE, [])
+    APPOINTMENTS.clear()
+    APPTS_BY_DATE.clear()
+    persist_appointments()
     return {"status": "success", "message": "All appointments cleared"}
 
 
 @app.delete("/appointments/{index}")
 async def delete_appointment(index: int):
     """Delete a specific appointment by index"""
-    appointments = load_json(APPOINTMENTS_FILE)
-    if 0 <= index < len(appointments):
-        deleted = appointments.pop(index)
-        save_json(APPOINTMENTS_FILE, appointments)
+    if 0 <= index < len(APPOINTMENTS):
+        deleted = APPOINTMENTS.pop(index)
+        rebuild_appointment_index()
+        persist_appointments()
         return {"status": "success", "deleted": deleted}
     else:
         raise HTTPException(status_code=404, detail="Appointment not found")
 
 
 @app.get("/knowledge_base")
-async def get_knowledge_base():
+async def get_knowledge_base(request: Request):
     """Get the complete knowledge base for the voice agent"""
-    return load_json(KNOWLEDGE_BASE_FILE)
+    return static_json_response(request, KNOWLEDGE_BASE_FILE)
 
 
 @app.get("/appointments")
 async def get_all_appointments():
     """Get all booked appointments"""
-    return load_json(APPOINTMENTS_FILE)
+    return StreamingResponse(stream_json_array(list(APPOINTMENTS)), media_type="application/json")
 
 
 @app.get("/schedules")
-async def get_schedules():
+async def get_schedules(request: Request):
     """Get doctor schedules for all days"""
-    return load_json(SCHEDULES_FILE)
+    return static_json_response(request, SCHEDULES_FILE)
 
 
 @app.get("/get_slots/{day}")
-async def get_slots(day: str):
+async def get_slots(day: str, today: datetime = Depends(_today)):
     """Get available appointment slots for a specific day"""
     try:
         day = day.capitalize()
         
-        schedules = load_json(SCHEDULES_FILE)
-        if day not in schedules:
+        day_meta = get_day_meta()
+        if day not in day_meta:
             return {
                 "response": f"Sorry, the clinic is closed on {day}. We're open Monday through Saturday."
             }
         
-        schedule = schedules[day]
-        doctor = schedule["doctor"]
-        start_time = schedule["start_time"]
-        end_time = schedule["end_time"]
-        
-        all_slots = generate_time_slots(start_time, end_time, interval=30)
-        
-        lunch_start = "13:00"
-        lunch_end = "14:00"
-        available_slots = [
-            slot for slot in all_slots
-            if not (lunch_start <= slot < lunch_end)
-        ]
+        meta = day_meta[day]
+        doctor = meta["doctor"]
         
-        day_date = get_day_date(day)
-        appointments = load_json(APPOINTMENTS_FILE)
-        
-        for appointment in appointments:
-            appt_start = datetime.fromisoformat(appointment["start_time"])
-            appt_end = datetime.fromisoformat(appointment["end_time"])
-            
-            if appt_start.date() == day_date.date():
-                available_slots = [
-                    slot for slot in available_slots
-                    if not is_time_in_range(slot, appt_start, appt_end, day_date)
+        day_date = get_day_date(day, today)
+        day_appts = APPTS_BY_DATE.get(day_date.date())
+        if not day_appts:
+            available_slots = meta["available_labels"]
+        else:
+            available_minutes = meta["available_template"]
+            for appt_start, appt_end in day_appts:
+                available_minutes = [
+                    m for m in available_minutes
+                    if not (m < appt_end and m + SLOT_MINUTES > appt_start)
                 ]
+            available_slots = [format_minutes(m) for m in available_minutes]
         
         if available_slots:
             first_slot = available_slots[0]
@@ -225,113 +455,99 @@ async def get_slots(day: str):
 
 
 @app.post("/log_booking")
-async def log_booking(request: dict):
+async def log_booking(booking: BookingRequest, today: datetime = Depends(_today)) -> ORJSONResponse:
     """Book an appointment"""
     try:
-        name = request.get("name", "").strip()
-        doctor = request.get("doctor", "").strip()
-        day = request.get("day", "").capitalize()
-        slot = request.get("slot", "").strip()
+        name = booking.name
+        doctor = booking.doctor
+        day = booking.day
+        slot = booking.slot
         
         if not all([name, doctor, day, slot]):
-            return {
+            return ORJSONResponse({
                 "response": "I need your name, the doctor, day, and time slot to book the appointment. Let's start over."
-            }
+            })
         
-        schedules = load_json(SCHEDULES_FILE)
+        day_meta = get_day_meta()
 
         # Day and doctor basic checks
-        if day not in schedules:
-            return {
+        if day not in day_meta:
+            return ORJSONResponse({
                 "response": f"Sorry, the clinic is closed on {day}. Please choose a weekday or Saturday."
-            }
+            })
 
-        if schedules[day]["doctor"] != doctor:
-            return {
-                "response": f"{doctor} is not available on {day}. {schedules[day]['doctor']} is available that day."
-            }
+        meta = day_meta[day]
+        if meta["doctor"] != doctor:
+            return ORJSONResponse({
+                "response": f"{doctor} is not available on {day}. {meta['doctor']} is available that day."
+            })
 
         # Validate slot time format
         try:
-            slot_time = datetime.strptime(slot, "%H:%M")
+            slot_start_min = parse_slot_minutes(slot)
         except ValueError:
-            return {"response": f"I couldn't understand the time '{slot}'. Please provide it in 24-hour format like 14:00."}
+            return ORJSONResponse({"response": f"I couldn't understand the time '{slot}'. Please provide it in 24-hour format like 14:00."})
 
-        day_date = get_day_date(day)
+        day_date = get_day_date(day, today)
         start_datetime = day_date.replace(
-            hour=slot_time.hour,
-            minute=slot_time.minute,
+            hour=slot_start_min // 60,
+            minute=slot_start_min % 60,
             second=0,
             microsecond=0
         )
         end_datetime = start_datetime + timedelta(minutes=30)
 
         # Check working hours and lunch break
-        work_start = datetime.strptime(schedules[day]["start_time"], "%H:%M").time()
-        work_end = datetime.strptime(schedules[day]["end_time"], "%H:%M").time()
-        slot_time_only = slot_time.time()
-
-        # Lunch block
-        lunch_start = datetime.strptime("13:00", "%H:%M").time()
-        lunch_end = datetime.strptime("14:00", "%H:%M").time()
+        work_start = meta["work_start_min"]
+        work_end = meta["work_end_min"]
+        slot_end_min = slot_start_min + SLOT_MINUTES
 
         # If slot starts before or at work_start or ends after work_end -> outside hours
-        slot_end_time = (datetime.combine(day_date.date(), slot_time_only) + timedelta(minutes=30)).time()
+        if not (work_start <= slot_start_min < work_end) or not (work_start < slot_end_min <= work_end):
+            return ORJSONResponse({"response": f"Sorry, {doctor} is not available at {slot} on {day} — that's outside of working hours ({meta['start_time']}–{meta['end_time']}). Would you like another time?"})
 
-        if not (work_start <= slot_time_only < work_end) or not (work_start < slot_end_time <= work_end):
-            return {"response": f"Sorry, {doctor} is not available at {slot} on {day} — that's outside of working hours ({schedules[day]['start_time']}–{schedules[day]['end_time']}). Would you like another time?"}
-
-        if (lunch_start <= slot_time_only < lunch_end) or (lunch_start < slot_end_time <= lunch_end):
-            return {"response": f"Sorry, {doctor} is not available at {slot} on {day} — that falls during our lunch break (13:00–14:00). Would you like a time before or after lunch?"}
+        if (LUNCH_START_MIN <= slot_start_min < LUNCH_END_MIN) or (LUNCH_START_MIN < slot_end_min <= LUNCH_END_MIN):
+            return ORJSONResponse({"response": f"Sorry, {doctor} is not available at {slot} on {day} — that falls during our lunch break (13:00–14:00). Would you like a time before or after lunch?"})
 
         # Check for conflicts with existing appointments
-        appointments = load_json(APPOINTMENTS_FILE)
-        for appointment in appointments:
-            appt_start = datetime.fromisoformat(appointment["start_time"])
-            appt_end = datetime.fromisoformat(appointment["end_time"])
-            if appt_start.date() == day_date.date():
-                # overlap check
-                if not (end_datetime <= appt_start or start_datetime >= appt_end):
-                    return {"response": f"Sorry, {doctor} already has an appointment at {slot} on {day} (the 30-minute slot is taken). Would you like a different time?"}
+        for appt_start, appt_end in APPTS_BY_DATE.get(day_date.date(), ()):
+            # overlap check
+            if slot_start_min < appt_end and slot_end_min > appt_start:
+                return ORJSONResponse({"response": f"Sorry, {doctor} already has an appointment at {slot} on {day} (the 30-minute slot is taken). Would you like a different time?"})
 
         # All good — create appointment
         appointment_entry = {
             "name": name,
             "start_time": start_datetime.isoformat(),
-            "end_time": end_datetime.isoformat()
+            "end_time": end_datetime.isoformat(),
+            "date": start_datetime.date().isoformat(),
+            "start_min": slot_start_min,
+            "end_min": slot_end_min
         }
 
-        print("\n" + "="*60)
-        print("NEW APPOINTMENT BOOKED")
-        print("="*60)
-        print(f"Patient Name: {name}")
-        print(f"Doctor: {doctor}")
-        print(f"Day: {day}")
-        print(f"Time Slot: {slot}")
-        print(f"Date: {start_datetime.strftime('%Y-%m-%d')}")
-        print(f"Duration: 30 minutes")
-        print("="*60 + "\n")
-
-        appointments.append(appointment_entry)
-        save_json(APPOINTMENTS_FILE, appointments)
+        logger.info("Booked: name=%s doctor=%s day=%s slot=%s", name, doctor, day, slot)
+
+        APPOINTMENTS.append(appointment_entry)
+        APPTS_BY_DATE[day_date.date()].append((slot_start_min, slot_end_min))
+        persist_appointments()
         formatted_date = format_date_ordinal(start_datetime)
         response = f"Perfect! I've booked your appointment with {doctor} on {formatted_date} at {slot}. Is there anything else I can help you with?"
 
-        return {
+        return ORJSONResponse({
             "response": response,
             "status": "success",
             "appointment": appointment_entry
-        }
+        })
     
     except Exception as e:
         print(f"Error in book_appointment webhook: {e}")
-        return {
+        return ORJSONResponse({
             "response": "I'm having trouble booking the appointment right now. Please try again or call us directly."
-        }
+        })
 
 
 if __name__ == "__main__":
     import uvicorn
     print("Starting Clinic Voice Agent Backend...")
     print("API Documentation: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="warning")